@@ -1,15 +1,22 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
+import asyncio
+import collections
 import json
 import os
 import sys
+import time
 import traceback
 import logging
 import io
-import urllib.request
-from PIL import Image, ImageTk
-from bosesoundtouchapi import *
-from bosesoundtouchapi.models import *
+import itertools
+import queue
+import threading
+
+try:
+    import orjson  # Optional: much faster JSON parse/dump for the devices file
+except ImportError:
+    orjson = None
 
 # Configure logging
 logging.basicConfig(
@@ -23,6 +30,52 @@ logger = logging.getLogger(__name__)
 
 # Constants
 DEVICES_FILE = "soundtouch_devices.json"
+UI_POLL_MS = 50  # How often the Tk thread runs callbacks queued by workers
+LISTBOX_BATCH = 10  # Saved-device rows inserted per idle callback
+SOUNDTOUCH_SERVICE = "_soundtouch._tcp.local."
+ART_CACHE_DIR = os.path.expanduser("~/.cache/soundtouch_art")
+ART_CACHE_SIZE = 64 * 1024 * 1024  # Bytes of resized artwork kept on disk
+ART_MAX_SIZE = (400, 400)
+ART_PHOTO_CACHE_SIZE = 32  # Ready-to-show PhotoImages kept in memory
+STATUS_CACHE_TTL = 2.0  # Seconds a fetched device status is reused
+DEVICE_CONNECT_TIMEOUT = 3  # Seconds to wait for a device's HTTP connection (SDK default is 30)
+DEVICE_READ_TIMEOUT = 5  # Seconds to wait for a device's reply (SDK default is forever)
+DISCOVERY_PROBE_TIMEOUT = 5.0  # Seconds discovery waits for all devices to be probed
+NOTIFY_PING_INTERVAL = 15  # Seconds between websocket keep-alives; the SDK needs more than its 10 s pong timeout
+
+# (attribute, label) pairs shown in the status text when set
+_CONTENT_FIELDS = (('Name', 'Playing'), ('Source', 'Source'))
+_NOW_PLAYING_FIELDS = (('Artist', 'Artist'), ('Album', 'Album'), ('Track', 'Track'))
+
+# bosesoundtouchapi (and zeroconf, urllib3, etc. behind it) is imported on first
+# use by _ensure_sdk so the window can paint before the SDK has loaded
+SoundTouchClient = None
+SoundTouchDevice = None
+SoundTouchDiscovery = None
+_device_http = None  # urllib3 pool shared by every device and client, with a read timeout
+
+def _ensure_sdk():
+    """Import the bosesoundtouchapi classes into module globals on first use."""
+    global SoundTouchClient, SoundTouchDevice, SoundTouchDiscovery, _device_http
+    if SoundTouchDiscovery is None:
+        import urllib3  # Installed with bosesoundtouchapi
+        # The SDK's own pools never time out a read, so a device that accepts the
+        # connection but doesn't reply would hold an I/O thread forever. Retry only
+        # failed connects (e.g. a stale keep-alive), never a read that timed out.
+        _device_http = urllib3.PoolManager(
+            headers={'User-Agent': 'BoseSoundTouchApi/1.0.0'},
+            timeout=urllib3.Timeout(connect=DEVICE_CONNECT_TIMEOUT, read=DEVICE_READ_TIMEOUT),
+            retries=urllib3.Retry(total=1, read=0),
+            maxsize=8)
+        from bosesoundtouchapi import SoundTouchClient, SoundTouchDevice, SoundTouchDiscovery
+
+def _device_label(info):
+    """Display label for a device, e.g. "Kitchen ST10 (192.168.1.20:8090)"."""
+    return f"{info.get('name', 'Unknown')} ({info.get('host', 'Unknown')}:{info.get('port', 8090)})"
+
+def _device_key(info):
+    """Key for devices and saved_devices: the MAC, which survives DHCP address changes."""
+    return info.get('mac') or _device_label(info)
 
 class SoundTouchApp:
     def __init__(self, root):
@@ -31,23 +84,121 @@ class SoundTouchApp:
         self.root.geometry("600x700")  # Increased size to accommodate artwork
         
         # Initialize devices and client
-        self.devices = {}
+        self.devices = {}  # Discovered devices, keyed like saved_devices
+        self._label_to_key = {}  # Dropdown label -> devices key
+        self._last_devices_keys = ()  # Labels last pushed to the dropdown
         self.saved_devices = {}
+        self._saved_order = []  # saved_devices keys in listbox order
+        self._listbox_fill = None  # Iterator of rows still to insert
         self.selected_device = None
         self.selected_client = None  # Initialize client
+        self._status_update_job = None  # Pending after() id of the status poll
+        self._status_future = None  # Future of the last refresh_status fetch
+        self._ws = None  # Notification websocket for selected_client; polling is the fallback
         self._updating_volume = False  # Flag to prevent update loops
+        self._last_status = None  # Text currently shown in status_var
+        self._status_lines = []  # Lines of the last rendered device status
+        self._status_index = {}  # Line label (e.g. 'Volume') -> index in _status_lines
+        self._status_text = None  # _status_lines joined, as last shown
+        self._visible = True  # False while the window is minimized or withdrawn
+        self._ui_q = queue.Queue()  # Callbacks from worker threads, run on the Tk thread
+        self._vol_after_id = None  # Pending debounced volume write
+        self._vol_pending = None  # (client, level) waiting for the debounced write
         self.current_artwork_url = None
         self.artwork_label = None
         self.photo = None  # Keep a reference to prevent garbage collection
+        self._art_cache = None  # URL -> resized PNG bytes, if diskcache is installed
+        self._art_cache_opened = False  # _art_disk_cache has tried to open _art_cache
+        self._http = None  # Keep-alive connection pool for artwork, created on first use
+        self._art_generation = 0  # Bumped per artwork request; older loads give up
+        self._photo_cache = collections.OrderedDict()  # URL -> PhotoImage, least recently used first
+        # One long-lived worker for artwork; loads run one at a time, newest last.
+        # A daemon thread, so a stalled download can't hold up exit.
+        self._art_q = queue.Queue()
+        threading.Thread(target=self._art_loop, daemon=True).start()
+        self._device_cache = {}  # (host, port) -> SoundTouchDevice
+        self._connect_seq = 0  # Bumped per connect request; stale results are dropped
+        self._status_cache = {}  # host -> (fetch time, status snapshot)
+        self._discovering = False
+        self._disc_on_complete = []  # Callbacks to run after the current discovery succeeds
+        self._live_devices = {}  # "host:port" -> service name, kept current by the zeroconf browser
+        self._live_lock = threading.Lock()
+        self._zeroconf = None
+        self._save_dirty = False  # saved_devices changed since the last write
+        self._save_after_id = None
+        self._save_q = queue.Queue(maxsize=1)  # Latest snapshot waiting for the saver thread
+        threading.Thread(target=self._saver_loop, daemon=True).start()
+        
+        # Blocking device I/O runs as coroutines on an asyncio loop in its own thread,
+        # leaving the main thread to Tk. Results come back via root.after.
+        self.loop = asyncio.new_event_loop()
+        threading.Thread(target=self.loop.run_forever, daemon=True).start()
         
         # Create UI
         self.setup_ui()
+        self._pump_ui()
+        
+        # Pause status polling while the window can't be seen
+        self.root.bind('<Map>', self._on_map)
+        self.root.bind('<Unmap>', self._on_unmap)
+        
+        # Load the SDK and start listening for devices once the window is up
+        self.root.after_idle(lambda: threading.Thread(target=self._background_start, daemon=True).start())
+        
+        # Write any pending device changes before the window goes away
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
         
         # Load saved devices and discover
         self.load_devices()
         if not self.saved_devices:
             self.discover_devices()
     
+    def _background_start(self):
+        """Warm the SDK import and start passive discovery. Runs on a worker thread."""
+        _ensure_sdk()
+        self._start_live_discovery()
+    
+    def _start_live_discovery(self):
+        """Keep a zeroconf browser running so discovery can answer from its cache."""
+        zc = None
+        try:
+            from zeroconf import ServiceBrowser, Zeroconf
+            zc = Zeroconf()
+            ServiceBrowser(zc, SOUNDTOUCH_SERVICE, handlers=[self._on_service_state_change])
+            # Only now can discovery rely on the browser's cache
+            self._zeroconf = zc
+        except Exception as e:
+            logger.warning(f"Passive discovery unavailable, using active scans only: {str(e)}")
+            if zc is not None:
+                zc.close()
+    
+    def _on_service_state_change(self, zeroconf, service_type, name, state_change):
+        """Track SoundTouch services as they come and go. Runs on a zeroconf thread."""
+        from zeroconf import IPVersion, ServiceStateChange
+        device_name = name.split(".")[0]
+        if state_change is ServiceStateChange.Removed:
+            with self._live_lock:
+                for key in [k for k, v in self._live_devices.items() if v == device_name]:
+                    del self._live_devices[key]
+            return
+        
+        info = zeroconf.get_service_info(service_type, name)
+        if info is None:
+            return
+        with self._live_lock:
+            for address in info.parsed_addresses(IPVersion.V4Only):
+                self._live_devices[f"{address}:{info.port}"] = device_name
+        logger.debug(f"Zeroconf saw SoundTouch device: {device_name}")
+    
+    def on_close(self):
+        """Flush pending saves and close the window."""
+        if self._zeroconf:
+            self._zeroconf.close()
+        self._stop_status_updates()
+        self._flush_save()
+        self._save_q.join()
+        self.root.destroy()
+    
     def setup_ui(self):
         # Device selection
         ttk.Label(self.root, text="Select Device:").pack(pady=5)
@@ -63,7 +214,8 @@ class SoundTouchApp:
         self.volume_slider.pack(pady=5, padx=10, fill='x')
         
         # Power button
-        self.power_btn = ttk.Button(self.root, text="Power On/Off", command=self.toggle_power)
+        self.power_btn = ttk.Button(self.root, text="Power On/Off",
+                                    command=lambda: self.run_async(self.toggle_power()))
         self.power_btn.pack(pady=10)
         
         # Artwork display
@@ -74,7 +226,7 @@ class SoundTouchApp:
         
         # Status display
         self.status_var = tk.StringVar()
-        self.status_var.set("Select a device to begin")
+        self.set_status("Select a device to begin")
         ttk.Label(self.root, textvariable=self.status_var, wraplength=550).pack(pady=10)
         
         # Button frame
@@ -93,126 +245,323 @@ class SoundTouchApp:
         # Remove button for saved devices
         ttk.Button(self.root, text="Remove Selected", command=self.remove_device).pack(pady=5)
     
+    def set_status(self, status):
+        """Show status text, skipping the Tk update when it hasn't changed."""
+        if status != self._last_status:
+            self.status_var.set(status)
+            self._last_status = status
+    
     def log_error(self, message, exc_info=None):
         """Log error to both console and update status."""
         error_msg = f"Error: {message}"
         logger.error(error_msg, exc_info=exc_info)
-        self.status_var.set(error_msg)
+        self.set_status(error_msg)
         
-        # Also print full traceback to console if available
-        if exc_info:
+        # Also print full traceback to console if available. An exception instance
+        # may be handed over from a worker after its handler has exited, when
+        # print_exc() has nothing to show; logger.error already printed its traceback.
+        if exc_info and not isinstance(exc_info, BaseException):
             traceback.print_exc()
     
-    def discover_devices(self):
-        self.status_var.set("Discovering devices...")
-        self.root.update()
+    def _ui(self, fn, *args):
+        """Run fn(*args) on the Tk thread. The only way worker code may touch Tk."""
+        self._ui_q.put((fn, args))
+    
+    def _pump_ui(self):
+        """Run callbacks queued by _ui. Runs on the Tk thread."""
+        while True:
+            try:
+                fn, args = self._ui_q.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                fn(*args)
+            except Exception as e:
+                logger.error(f"Error in UI callback {fn!r}: {str(e)}", exc_info=True)
+        self.root.after(UI_POLL_MS, self._pump_ui)
+    
+    def run_async(self, coro):
+        """Schedule a coroutine on the I/O loop from the Tk thread."""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+    
+    def refresh_status(self, force=False):
+        """Request a device status update without blocking the Tk thread."""
+        self._status_future = self.run_async(self.update_device_status(force))
+    
+    def _get_device(self, host, port=8090):
+        """Return the cached SoundTouchDevice for host:port, creating it on first use."""
+        key = (host, port)
+        device = self._device_cache.get(key)
+        if device is None:
+            _ensure_sdk()
+            device = SoundTouchDevice(host, connectTimeout=DEVICE_CONNECT_TIMEOUT, port=port,
+                                      proxyManager=_device_http)
+            self._device_cache[key] = device
+        return device
+    
+    def discover_devices(self, on_complete=None):
+        """Start device discovery on a worker thread; results are applied on the Tk thread."""
+        if on_complete:
+            self._disc_on_complete.append(on_complete)
+        if self._discovering:
+            # Ride along with the running discovery; on_complete runs when it finishes
+            logger.debug("Discovery already in progress")
+            return
+        self._discovering = True
+        self.set_status("Discovering devices...")
+        
+        logger.info("Starting device discovery...")
+        self.run_async(self._discover_worker())
+    
+    async def _discover_worker(self):
+        """Run the blocking discovery and hand the result to _apply_discovery via _ui.
         
+        Runs on the I/O loop, so it must never touch Tk widgets or variables.
+        """
         try:
-            logger.info("Starting device discovery...")
-            discovery = SoundTouchDiscovery(False)
-            devices = discovery.DiscoverDevices(timeout=5)
-            
-            self.devices = {}
-            for device in devices:
-                device_key = None
-                try:
-                    # Handle case where device might be a string (hostname:port) or object
-                    if isinstance(device, str):
-                        # If it's a string, parse host and port
-                        if ':' in device:
-                            host, port = device.split(':', 1)
-                            port = int(port)  # Convert port to int if needed
-                        else:
-                            host = device
-                            port = 8090  # Default port for SoundTouch
-                        
-                        # Create device object with explicit host and port
-                        device_obj = SoundTouchDevice(host, port=port)
-                        device_key = f"{device_obj.DeviceName} ({host}:{port})"
-                        self.devices[device_key] = {
-                            'host': host,
-                            'name': device_obj.DeviceName,
-                            'port': port,  # Use the port we parsed earlier
-                            'mac': getattr(device_obj, 'DeviceId', '')
-                        }
-                    else:
-                        # Original object handling with proper attribute access
-                        host = getattr(device, 'Host', 'unknown')
-                        name = getattr(device, 'DeviceName', 'Unknown Device')
-                        port = getattr(device, 'Port', 8090)  # Default port if not available
-                        device_id = getattr(device, 'DeviceId', '')
-                        
-                        device_key = f"{name} ({host})"
-                        self.devices[device_key] = {
-                            'host': host,
-                            'name': name,
-                            'port': port,
-                            'mac': device_id
-                        }
-                    
-                    if device_key:  # Only log if we successfully created a device key
-                        logger.info(f"Discovered device: {device_key}")
-                        
-                except Exception as e:
-                    logger.error(f"Error processing device {device}: {str(e)}", exc_info=True)
-                    if device_key:  # Log the device key if we have it
-                        logger.error(f"Error with device: {device_key}")
-            
-            self.update_device_dropdown()
-            if self.devices:
-                self.device_dropdown.current(0)
-                self.on_device_select()
-                status_msg = f"Found {len(self.devices)} device(s)"
-                logger.info(status_msg)
-                self.status_var.set(status_msg)
+            # Devices the zeroconf browser already knows about answer instantly;
+            # only fall back to a full timed scan when it has seen nothing yet
+            with self._live_lock:
+                devices = dict(self._live_devices)
+            if not devices and self._zeroconf:
+                # Wait on the running browser; a fresh SoundTouchDiscovery would build
+                # another Zeroconf, re-enumerating interfaces and binding new sockets
+                devices = await self._wait_for_live_devices(timeout=5)
+            elif not devices:
+                await asyncio.to_thread(_ensure_sdk)
+                discovery = SoundTouchDiscovery(False)
+                devices = await asyncio.to_thread(discovery.DiscoverDevices, timeout=5)
+            result = await asyncio.to_thread(self._build_devices, devices)
+            self._ui(self._apply_discovery, 'ok', result)
+        except Exception as e:
+            self._ui(self._apply_discovery, 'err', e)
+    
+    async def _wait_for_live_devices(self, timeout):
+        """Poll the zeroconf cache until devices show up or timeout seconds pass."""
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            await asyncio.sleep(0.25)
+            with self._live_lock:
+                seen = bool(self._live_devices)
+            if seen:
+                # Give the rest of the devices a moment to answer
+                await asyncio.sleep(0.5)
+                break
+        with self._live_lock:
+            return dict(self._live_devices)
+    
+    def _build_devices(self, devices):
+        """Build the device info dict from discovery results.
+        
+        Each device is probed on its own thread, so N devices cost about
+        one round-trip instead of N. Results keep the discovery order; devices
+        that haven't answered within DISCOVERY_PROBE_TIMEOUT are left out.
+        """
+        result = {}
+        devices = list(devices)
+        entries = [None] * len(devices)
+        
+        def probe(i, device):
+            entries[i] = self._build_device_info(device)
+        
+        # Daemon threads: the SDK sets no read timeout, so a device that accepts the
+        # connection but never replies would otherwise keep the process alive at exit
+        threads = [threading.Thread(target=probe, args=(i, device), daemon=True)
+                   for i, device in enumerate(devices)]
+        for t in threads:
+            t.start()
+        deadline = time.monotonic() + DISCOVERY_PROBE_TIMEOUT
+        for i, (device, t) in enumerate(zip(devices, threads)):
+            t.join(max(0.0, deadline - time.monotonic()))
+            if t.is_alive():
+                logger.warning(f"Device {device} did not answer in time; skipping")
+                continue
+            if entries[i]:
+                device_key, info = entries[i]
+                result[device_key] = info
+        return result
+    
+    def _build_device_info(self, device):
+        """Return (device_key, info) for one discovery result, or None on failure."""
+        try:
+            # Handle case where device might be a string (hostname:port) or object
+            if isinstance(device, str):
+                # If it's a string, parse host and port
+                if ':' in device:
+                    host, port = device.split(':', 1)
+                    port = int(port)  # Convert port to int if needed
+                else:
+                    host = device
+                    port = 8090  # Default port for SoundTouch
+                
+                # Create device object with explicit host and port
+                device_obj = self._get_device(host, port)
+                info = {
+                    'host': host,
+                    'name': device_obj.DeviceName,
+                    'port': port,  # Use the port we parsed earlier
+                    'mac': getattr(device_obj, 'DeviceId', '')
+                }
             else:
-                status_msg = "No devices found. Check your network connection."
-                logger.warning(status_msg)
-                self.status_var.set(status_msg)
+                # Original object handling with proper attribute access
+                host = getattr(device, 'Host', 'unknown')
+                name = getattr(device, 'DeviceName', 'Unknown Device')
+                port = getattr(device, 'Port', 8090)  # Default port if not available
+                device_id = getattr(device, 'DeviceId', '')
+                
+                info = {
+                    'host': host,
+                    'name': name,
+                    'port': port,
+                    'mac': device_id
+                }
+            
+            logger.info(f"Discovered device: {_device_label(info)}")
+            return _device_key(info), info
                 
         except Exception as e:
-            self.log_error(f"Discovery failed: {str(e)}", exc_info=True)
+            logger.error(f"Error processing device {device}: {str(e)}", exc_info=True)
+            return None
+    
+    def _apply_discovery(self, kind, payload):
+        """Apply discovery results once the worker has finished. Runs on the Tk thread."""
+        self._discovering = False
+        callbacks = self._disc_on_complete
+        self._disc_on_complete = []
+        
+        if kind == 'err':
+            self.log_error(f"Discovery failed: {str(payload)}", exc_info=payload)
+            return
+        
+        self.devices = payload
+        self.update_device_dropdown()
+        if self.devices:
+            self.device_dropdown.current(0)
+            self.on_device_select()
+            status_msg = f"Found {len(self.devices)} device(s)"
+            logger.info(status_msg)
+            self.set_status(status_msg)
+        else:
+            status_msg = "No devices found. Check your network connection."
+            logger.warning(status_msg)
+            self.set_status(status_msg)
+        
+        for on_complete in callbacks:
+            on_complete()
     
     def load_devices(self):
         """Load saved devices from JSON file."""
         try:
             if os.path.exists(DEVICES_FILE):
-                with open(DEVICES_FILE, 'r') as f:
-                    self.saved_devices = json.load(f)
+                with open(DEVICES_FILE, 'rb') as f:
+                    data = f.read()
+                loaded = orjson.loads(data) if orjson else json.loads(data)
+                # Older files are keyed by "Name (host:port)"; re-key them by MAC
+                self.saved_devices = {_device_key(info): info for info in loaded.values()}
+                if self.saved_devices.keys() != loaded.keys():
+                    self._schedule_save()
                 self.update_device_listbox()
                 if self.saved_devices:
-                    self.status_var.set(f"Loaded {len(self.saved_devices)} saved devices")
+                    self.set_status(f"Loaded {len(self.saved_devices)} saved devices")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load devices: {str(e)}")
     
     def save_devices(self):
-        """Save current devices to JSON file."""
+        """Hand a snapshot of saved devices to the background writer."""
         try:
-            with open(DEVICES_FILE, 'w') as f:
-                json.dump(self.saved_devices, f, indent=2)
-            self.update_device_listbox()
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to save devices: {str(e)}")
+            # Replace a snapshot that hasn't been written yet; only the latest matters
+            self._save_q.get_nowait()
+            self._save_q.task_done()
+        except queue.Empty:
+            pass
+        self._save_q.put(dict(self.saved_devices))
+    
+    def _saver_loop(self):
+        """Write queued snapshots to disk. Runs on the saver thread."""
+        while True:
+            snapshot = self._save_q.get()
+            try:
+                self._write_devices(snapshot)
+            except Exception as e:
+                logger.error(f"Failed to save devices: {str(e)}", exc_info=True)
+                self._ui(messagebox.showerror, "Error", f"Failed to save devices: {str(e)}")
+            finally:
+                self._save_q.task_done()
+    
+    def _write_devices(self, devices):
+        """Atomically replace the JSON file with devices."""
+        if orjson:
+            data = orjson.dumps(devices, option=orjson.OPT_INDENT_2)
+        else:
+            data = json.dumps(devices, indent=2).encode('utf-8')
+        # Write beside the real file and swap it in, so a crash mid-write
+        # never leaves a truncated devices file behind
+        tmp = DEVICES_FILE + '.tmp'
+        try:
+            with open(tmp, 'wb') as f:
+                f.write(data)
+            os.replace(tmp, DEVICES_FILE)
+        except OSError:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            raise
+    
+    def _schedule_save(self):
+        """Update the listbox now and write saved devices once changes settle."""
+        self.update_device_listbox()
+        self._save_dirty = True
+        if self._save_after_id:
+            self.root.after_cancel(self._save_after_id)
+        self._save_after_id = self.root.after(500, self._flush_save)
+    
+    def _flush_save(self):
+        """Write saved devices if they changed since the last write."""
+        if self._save_after_id:
+            self.root.after_cancel(self._save_after_id)
+            self._save_after_id = None
+        if self._save_dirty:
+            self._save_dirty = False
+            self.save_devices()
     
     def update_device_dropdown(self):
         """Update the dropdown with discovered devices."""
-        self.device_dropdown['values'] = list(self.devices.keys())
+        self._label_to_key = {_device_label(info): key for key, info in self.devices.items()}
+        keys = tuple(self._label_to_key)
+        if keys != self._last_devices_keys:
+            self.device_dropdown['values'] = keys  # ttk takes the tuple as is
+            self._last_devices_keys = keys
     
     def update_device_listbox(self):
         """Update the listbox with saved devices."""
         self.device_listbox.delete(0, tk.END)
-        for name, device in self.saved_devices.items():
-            self.device_listbox.insert(tk.END, f"{device.get('name', 'Unknown')} ({device.get('host', 'Unknown')})")
+        self._saved_order = list(self.saved_devices.keys())
+        self._listbox_fill = iter(list(self.saved_devices.values()))
+        self._insert_next_batch(self._listbox_fill)
+    
+    def _insert_next_batch(self, items):
+        """Insert up to LISTBOX_BATCH rows, then yield to Tk until the next idle."""
+        if items is not self._listbox_fill:
+            return  # A newer rebuild has started
+        rows = tuple(_device_label(d) for d in itertools.islice(items, LISTBOX_BATCH))
+        if rows:
+            # One Tcl call for the whole batch instead of one per row
+            self.device_listbox.insert(tk.END, *rows)
+        if len(rows) < LISTBOX_BATCH:
+            self._listbox_fill = None
+            return
+        self.root.after_idle(self._insert_next_batch, items)
     
     def discover_and_save(self):
         """Discover devices and add them to saved devices."""
-        self.discover_devices()
+        self.discover_devices(on_complete=self._save_discovered)
+    
+    def _save_discovered(self):
+        """Add the devices from the last discovery to saved devices."""
         if self.devices:
-            # Add newly discovered devices to saved devices
-            for name, device in self.devices.items():
-                if name not in self.saved_devices:
-                    self.saved_devices[name] = device
-            self.save_devices()
+            # Add newly discovered devices; a known device just gets its address updated
+            for key, device in self.devices.items():
+                self.saved_devices[key] = device
+            self._schedule_save()
             messagebox.showinfo("Success", f"Added {len(self.devices)} device(s) to saved devices")
     
     def refresh_devices(self):
@@ -223,49 +572,93 @@ class SoundTouchApp:
         """Handle selection from the saved devices listbox."""
         selection = self.device_listbox.curselection()
         if selection:
-            device_name = list(self.saved_devices.keys())[selection[0]]
-            if device_name in self.saved_devices:
-                device_info = self.saved_devices[device_name]
+            device_key = self._saved_order[selection[0]]
+            if device_key in self.saved_devices:
+                device_info = self.saved_devices[device_key]
+                device_name = device_info.get('name', device_key)
                 try:
                     logger.info(f"Connecting to device from list: {device_name}")
                     
                     # Clean up any previous instances
-                    if hasattr(self, 'selected_client'):
-                        del self.selected_client
-                    if hasattr(self, 'selected_device'):
-                        del self.selected_device
+                    self._stop_status_updates()
+                    self.selected_client = None
+                    self.selected_device = None
                     
                     # Initialize the device and client
                     host = device_info['host']
                     port = device_info.get('port', 8090)  # Default port if not specified
-                    logger.debug(f"Creating device with host: {host}, port: {port}")
                     
-                    self.selected_device = SoundTouchDevice(host, port=port)
-                    logger.debug("Creating SoundTouchClient")
-                    self.selected_client = SoundTouchClient(self.selected_device)
+                    def connected(device, client):
+                        self.selected_device = device
+                        self.selected_client = client
+                        
+                        # Update the UI
+                        if device_key in self.devices:
+                            self.device_var.set(_device_label(self.devices[device_key]))
+                        self.refresh_status()
+                        self._start_notifications(client)
+                    
+                    def failed(e):
+                        error_msg = f"Error connecting to device: {str(e)}"
+                        logger.error(error_msg, exc_info=e)
+                        self.set_status(error_msg)
                     
-                    # Update the UI
-                    if device_name in self.device_dropdown['values']:
-                        self.device_var.set(device_name)
-                    self.update_device_status()
+                    self.set_status(f"Connecting to {device_name}...")
+                    self.connect_device(host, port, connected, failed)
                     
                 except Exception as e:
                     error_msg = f"Error connecting to device: {str(e)}"
                     logger.error(error_msg, exc_info=True)
-                    self.status_var.set(error_msg)
+                    self.set_status(error_msg)
     
     def remove_device(self):
         """Remove the selected device from saved devices."""
         selection = self.device_listbox.curselection()
         if selection:
-            device_name = list(self.saved_devices.keys())[selection[0]]
-            del self.saved_devices[device_name]
-            self.save_devices()
-            self.status_var.set(f"Removed device: {device_name}")
+            device_key = self._saved_order[selection[0]]
+            device_info = self.saved_devices.pop(device_key)
+            self._device_cache.pop((device_info.get('host'), device_info.get('port', 8090)), None)
+            self._schedule_save()
+            self.set_status(f"Removed device: {device_info.get('name', device_key)}")
+    
+    def connect_device(self, host, port, on_connected, on_failed, test_connection=False):
+        """Open a device and client off the Tk thread.
+        
+        Calls on_connected(device, client) or on_failed(exc) on the Tk thread, but only
+        for the most recent request, so a slow device can't override a later click.
+        """
+        self._connect_seq += 1
+        self.run_async(self._connect_device(self._connect_seq, host, port,
+                                            on_connected, on_failed, test_connection))
+    
+    async def _connect_device(self, seq, host, port, on_connected, on_failed, test_connection):
+        try:
+            device, client = await asyncio.to_thread(self._open_client, host, port, test_connection)
+            self._ui(self._finish_connect, seq, on_connected, device, client)
+        except Exception as e:
+            self._ui(self._finish_connect, seq, on_failed, e)
+    
+    def _finish_connect(self, seq, callback, *args):
+        if seq == self._connect_seq:
+            callback(*args)
+    
+    def _open_client(self, host, port, test_connection):
+        """Create the device and client for host:port. Blocking; runs on a worker thread."""
+        logger.debug(f"Creating device with host: {host}, port: {port}")
+        device = self._get_device(host, port)
+        logger.debug("Creating SoundTouchClient")
+        _ensure_sdk()
+        client = SoundTouchClient(device, manager=_device_http)
+        
+        if test_connection:
+            logger.debug("Testing connection...")
+            now_playing = client.GetNowPlayingStatus(True)
+            logger.info(f"Successfully connected to {host}. Now playing: {getattr(now_playing, 'ContentItem', 'N/A')}")
+        return device, client
     
     def start_status_updates(self):
         """Start the periodic status update loop."""
-        if hasattr(self, '_status_update_job'):
+        if self._status_update_job:
             # Cancel any existing update job
             self.root.after_cancel(self._status_update_job)
         
@@ -274,238 +667,437 @@ class SoundTouchApp:
     
     def _update_status_loop(self):
         """Internal method to handle the status update loop."""
-        if hasattr(self, 'selected_client') and self.selected_client:
+        # Skip a tick while the last fetch is still out, so a slow device can't pile them up
+        busy = self._status_future is not None and not self._status_future.done()
+        if self._visible and self.selected_client and not busy:
             try:
-                self.update_device_status()
+                self.refresh_status()
             except Exception as e:
                 logger.error(f"Error in status update loop: {str(e)}", exc_info=True)
         
         # Schedule the next update
         self.start_status_updates()
+    
+    def _start_notifications(self, client):
+        """Subscribe to the device's change notifications, falling back to polling."""
+        self._stop_status_updates()
+        try:
+            from bosesoundtouchapi import SoundTouchNotifyCategorys
+            from bosesoundtouchapi.ws import SoundTouchWebSocket
+            # Without pings a speaker that drops off the network leaves a half-open
+            # socket that never errors, and the status would silently freeze
+            ws = SoundTouchWebSocket(client, pingInterval=NOTIFY_PING_INTERVAL)
+            ws.AddListener(SoundTouchNotifyCategorys.nowPlayingUpdated, self._on_push_event)
+            ws.AddListener(SoundTouchNotifyCategorys.volumeUpdated, self._on_push_event)
+            ws.AddListener(SoundTouchNotifyCategorys.WebSocketError, self._on_push_lost)
+            ws.AddListener(SoundTouchNotifyCategorys.WebSocketClose, self._on_push_lost)
+            ws.StartNotification()
+            self._ws = ws
+        except Exception as e:
+            logger.warning(f"Notifications unavailable, polling instead: {str(e)}")
+            self.start_status_updates()
+    
+    def _stop_status_updates(self):
+        """Cancel the status poll and close the notification websocket, if any."""
+        if self._status_update_job:
+            self.root.after_cancel(self._status_update_job)
+            self._status_update_job = None
+        if self._ws:
+            ws = self._ws
+            self._ws = None
+            ws.ClearListeners()
+            # Closing sends a close frame; keep that off the Tk thread
+            self.run_async(asyncio.to_thread(ws.StopNotification))
+    
+    def _on_push_event(self, client, event):
+        """Websocket listener; runs on the SDK's notification thread."""
+        if event.tag == 'volumeUpdated':
+            actual = event.findtext('volume/actualvolume')
+            if actual:
+                self._ui(self._apply_push_volume, client, int(actual))
+        else:
+            self._ui(self._apply_push_now_playing, client)
+    
+    def _on_push_lost(self, client, event):
+        """Websocket listener for errors and closes; runs on the SDK's notification thread."""
+        self._ui(self._fall_back_to_polling, client, event)
+    
+    def _apply_push_volume(self, client, volume):
+        """Show a pushed volume change without asking the device for its full status."""
+        if client is not self.selected_client:
+            return
+        self._status_cache.pop(getattr(self.selected_device, 'Host', None), None)
+        if self._updating_volume or self._vol_pending is not None:
+            return  # Our own debounced write is still on its way; don't fight the slider
+        self._updating_volume = True
+        try:
+            self.volume_slider.set(volume)
+        finally:
+            self._updating_volume = False
+        self._set_volume_line(volume)
+    
+    def _apply_push_now_playing(self, client):
+        """Refresh after a pushed now-playing change."""
+        if client is not self.selected_client:
+            return
+        self._status_cache.pop(getattr(self.selected_device, 'Host', None), None)
+        if self._visible:
+            self.refresh_status(force=True)
+    
+    def _fall_back_to_polling(self, client, event):
+        if client is not self.selected_client or self._ws is None:
+            return  # Already switched away, or this is the second report of the same loss
+        logger.warning(f"Notification websocket lost ({event!r}), polling instead")
+        self._stop_status_updates()
+        self.start_status_updates()
 
+    def _on_map(self, event):
+        # Child widgets report Map/Unmap through the root binding too; only the window counts
+        if event.widget is self.root and not self._visible:
+            self._visible = True
+            if self.selected_client:
+                self.refresh_status()
+    
+    def _on_unmap(self, event):
+        if event.widget is self.root:
+            self._visible = False
+    
     def on_device_select(self, event=None):
         selection = self.device_var.get()
-        if selection in self.devices:
-            device_info = self.devices[selection]
+        device_key = self._label_to_key.get(selection)
+        if device_key in self.devices:
+            device_info = self.devices[device_key]
             try:
                 logger.info(f"Connecting to device: {selection}")
                 
                 # Clean up any previous instances
-                if hasattr(self, 'selected_client'):
-                    if hasattr(self, '_status_update_job'):
-                        self.root.after_cancel(self._status_update_job)
-                    del self.selected_client
-                if hasattr(self, 'selected_device'):
-                    del self.selected_device
+                self._stop_status_updates()
+                self.selected_client = None
+                self.selected_device = None
                 
                 # Create new device instance
                 host = device_info['host']
                 port = device_info.get('port', 8090)  # Default port if not specified
-                logger.debug(f"Creating device with host: {host}, port: {port}")
                 
-                try:
-                    # Initialize the device and client
-                    self.selected_device = SoundTouchDevice(host, port=port)
-                    logger.debug("Creating SoundTouchClient")
-                    self.selected_client = SoundTouchClient(self.selected_device)
-                    
-                    # Test the connection
-                    logger.debug("Testing connection...")
-                    now_playing = self.selected_client.GetNowPlayingStatus(True)
-                    logger.info(f"Successfully connected to {host}. Now playing: {getattr(now_playing, 'ContentItem', 'N/A')}")
+                def connected(device, client):
+                    self.selected_device = device
+                    self.selected_client = client
                     
-                    # Add to saved devices if not already there
-                    if selection not in self.saved_devices:
-                        logger.info(f"Adding new device to saved devices: {selection}")
-                        self.saved_devices[selection] = device_info
-                        self.save_devices()
+                    # Add to saved devices if not already there, or update a changed address
+                    if self.saved_devices.get(device_key) != device_info:
+                        logger.info(f"Saving device: {selection}")
+                        self.saved_devices[device_key] = device_info
+                        self._schedule_save()
                     
-                    # Update UI with device status and start periodic updates
-                    self.update_device_status()
-                    self.start_status_updates()
-                    
-                except Exception as e:
-                    logger.error(f"Failed to connect to device {host}: {str(e)}", exc_info=True)
-                    self.status_var.set(f"Failed to connect: {str(e)}")
+                    # Update UI with device status, then follow changes as the device pushes them
+                    self.refresh_status()
+                    self._start_notifications(client)
+                
+                def failed(e):
+                    logger.error(f"Failed to connect to device {host}: {str(e)}", exc_info=e)
+                    self.set_status(f"Failed to connect: {str(e)}")
                     # Clean up on failure
-                    if hasattr(self, 'selected_client'):
-                        if hasattr(self, '_status_update_job'):
-                            self.root.after_cancel(self._status_update_job)
-                        del self.selected_client
-                        self.selected_client = None
-                    if hasattr(self, 'selected_device'):
-                        del self.selected_device
-                        self.selected_device = None
+                    self._stop_status_updates()
+                    self.selected_client = None
+                    self.selected_device = None
+                
+                self.set_status(f"Connecting to {selection}...")
+                self.connect_device(host, port, connected, failed, test_connection=True)
                     
             except Exception as e:
                 self.log_error(f"Error in device selection: {str(e)}", exc_info=True)
-                self.status_var.set(f"Error: {str(e)}")
+                self.set_status(f"Error: {str(e)}")
     
     def update_artwork(self, image_url):
         """Update the artwork display with the image from the given URL."""
+        self._art_generation += 1
+        gen = self._art_generation
+        
+        photo = self._photo_cache.get(image_url)
+        if photo is not None:
+            # Seen this cover recently; no download, decode or resize needed
+            self._photo_cache.move_to_end(image_url)
+            self.photo = photo
+            self.artwork_label.configure(image=photo)
+            return
+        
         def load_image():
+            # Imported on first artwork load rather than at startup; it is slow to import
+            from PIL import Image
+            if gen != self._art_generation:
+                return  # Superseded while waiting for the worker
             try:
-                with urllib.request.urlopen(image_url) as url:
-                    image_data = url.read()
+                art_cache = self._art_disk_cache()
+                cached = art_cache.get(image_url) if art_cache is not None else None
+                if cached is not None:
+                    # Already resized when it was stored; decode here, not on the Tk thread
+                    image = Image.open(io.BytesIO(cached))
+                    image.load()
+                else:
+                    resp = self._art_http().request('GET', image_url, timeout=5.0)
+                    if resp.status != 200:
+                        raise OSError(f"HTTP {resp.status}")
+                    image_data = resp.data
+                    if gen != self._art_generation:
+                        return  # The track changed while downloading; skip the decode
                     image = Image.open(io.BytesIO(image_data))
+                    # For JPEGs, let libjpeg decode straight at a reduced scale (no-op otherwise)
+                    image.draft('RGB', ART_MAX_SIZE)
                     
-                    # Resize image to fit in the UI (max 400x400)
-                    max_size = (400, 400)
-                    image.thumbnail(max_size, Image.Resampling.LANCZOS)
+                    # Resize image to fit in the UI (max 400x400); BILINEAR looks the
+                    # same as LANCZOS at this size for far less work
+                    image.thumbnail(ART_MAX_SIZE, Image.Resampling.BILINEAR)
                     
-                    # Convert to PhotoImage
-                    self.photo = ImageTk.PhotoImage(image)
-                    
-                    # Update the label in the main thread
-                    self.root.after(0, lambda: self.artwork_label.configure(image=self.photo))
+                    if art_cache is not None:
+                        # A failed write only costs the next session a download
+                        try:
+                            buf = io.BytesIO()
+                            image.save(buf, format='PNG')
+                            art_cache.set(image_url, buf.getvalue())
+                        except Exception as e:
+                            logger.warning(f"Could not cache artwork from {image_url}: {str(e)}")
+                
+                # PhotoImage is a Tk object, so it is created on the main thread
+                self._ui(self._show_artwork, image, gen, image_url)
                     
             except Exception as e:
                 logger.error(f"Error loading artwork from {image_url}: {str(e)}")
                 # Clear the artwork if there was an error
-                self.root.after(0, lambda: self.artwork_label.configure(image=''))
+                self._ui(self._show_artwork, None, gen, image_url)
         
-        # Run the image loading in a separate thread to avoid freezing the UI
-        import threading
-        threading.Thread(target=load_image, daemon=True).start()
+        # Load on the artwork worker to avoid freezing the UI; the result comes back via _ui
+        self._art_q.put(load_image)
+    
+    def _art_loop(self):
+        """Run queued artwork loads. Runs on the artwork thread."""
+        while True:
+            load = self._art_q.get()
+            try:
+                load()
+            except Exception as e:
+                logger.error(f"Artwork worker error: {str(e)}", exc_info=True)
+    
+    def _art_http(self):
+        """Return the shared urllib3 pool used for artwork downloads."""
+        if self._http is None:
+            import urllib3  # Installed with bosesoundtouchapi
+            self._http = urllib3.PoolManager(maxsize=4, retries=urllib3.Retry(2))
+        return self._http
+    
+    def _art_disk_cache(self):
+        """Return the on-disk artwork cache, opening it on first use; None if unavailable."""
+        if not self._art_cache_opened:
+            self._art_cache_opened = True
+            try:
+                import diskcache  # Optional: keeps resized artwork across sessions
+                self._art_cache = diskcache.Cache(ART_CACHE_DIR, size_limit=ART_CACHE_SIZE)
+            except ImportError:
+                pass
+            except Exception as e:
+                logger.warning(f"Artwork cache unavailable: {str(e)}")
+        return self._art_cache
+    
+    def _show_artwork(self, image, gen, image_url):
+        """Display a PIL image as the artwork, or clear it if image is None.
+        
+        Ignored if a newer artwork request (gen) has been made since.
+        """
+        if gen != self._art_generation:
+            return
+        if image is not None:
+            from PIL import ImageTk
+            self.photo = ImageTk.PhotoImage(image)
+            self._photo_cache[image_url] = self.photo
+            if len(self._photo_cache) > ART_PHOTO_CACHE_SIZE:
+                self._photo_cache.popitem(last=False)
+        else:
+            self.photo = None
+        self.artwork_label.configure(image=self.photo or '')
     
-    def update_device_status(self):
-        """Update the device status display with current information."""
-        logger.debug(f"update_device_status - selected_device: {getattr(self, 'selected_device', None)}")
+    async def update_device_status(self, force=False):
+        """Update the device status display with current information.
         
-        if not hasattr(self, 'selected_device') or not self.selected_device:
+        A status fetched less than STATUS_CACHE_TTL seconds ago is reused unless force is set.
+        """
+        logger.debug(f"update_device_status - selected_device: {self.selected_device}")
+        
+        if not self.selected_device:
             logger.warning("No device selected in update_device_status")
-            self.status_var.set("No device selected")
+            self._ui(self.set_status, "No device selected")
             return
             
         try:
-            status_parts = []
-            
-            # Get basic device info
-            if hasattr(self.selected_device, 'DeviceName'):
-                status_parts.append(self.selected_device.DeviceName)
-            
-            # Get fresh status from the client if available
-            if hasattr(self, 'selected_client') and self.selected_client:
-                try:
-                    now_playing = self.selected_client.GetNowPlayingStatus(True)
-                    if now_playing:
-                        # Update power state
-                        if hasattr(now_playing, 'PowerState'):
-                            status_parts.append(f"Power: {now_playing.PowerState}")
-                        
-                        # Update volume if available
-                        if not self._updating_volume:
-                            volume_info = self.selected_client.GetVolume(True)
-                            self.volume_slider.set(volume_info.Actual)
-                            status_parts.append(f"Volume: {volume_info.Actual}%")
-                        
-                        # Update content info if available
-                        if hasattr(now_playing, 'ContentItem'):
-                            content = now_playing.ContentItem
-                            if hasattr(content, 'Name') and content.Name:
-                                status_parts.append(f"Playing: {content.Name}")
-                            if hasattr(content, 'Source') and content.Source:
-                                status_parts.append(f"Source: {content.Source}")
-                        if hasattr(now_playing, 'Artist') and now_playing.Artist:
-                            status_parts.append(f"Artist: {now_playing.Artist}")
-                        if hasattr(now_playing, 'Album') and now_playing.Album:
-                            status_parts.append(f"Album: {now_playing.Album}")
-                        if hasattr(now_playing, 'Track') and now_playing.Track:
-                            status_parts.append(f"Track: {now_playing.Track}")
-                        if hasattr(now_playing, 'Duration') and now_playing.Duration:
-                            status_parts.append(f"Position: {now_playing.Position} of {now_playing.Duration}")
-                        if hasattr(now_playing, 'ArtUrl') and now_playing.ArtUrl:
-                            if now_playing.ArtUrl != self.current_artwork_url:
-                                self.current_artwork_url = now_playing.ArtUrl
-                                self.update_artwork(now_playing.ArtUrl)
-                except Exception as e:
-                    self.log_error(f"Error getting device status: {str(e)}")
-                    status_parts.append("Status: Error")
-            else:
-                status_parts.append("Status: Not connected")
-            
-            # Update the status display
-            if status_parts:
-                self.status_var.set("\n".join(status_parts))
+            # Capture the selection so a device switch mid-fetch can't mix devices
+            device = self.selected_device
+            client = self.selected_client
+            host = getattr(device, 'Host', None)
+            cached = self._status_cache.get(host)
+            if not force and cached and time.monotonic() - cached[0] < STATUS_CACHE_TTL:
+                status_parts, volume, art_url = cached[1]
             else:
-                self.status_var.set("No status available")
+                status_parts, volume, art_url = await asyncio.to_thread(self._fetch_status, device, client)
+                self._status_cache[host] = (time.monotonic(), (status_parts, volume, art_url))
+            self._ui(self._render_status, device, status_parts, volume, art_url)
                 
         except Exception as e:
-            self.log_error(f"Error in update_device_status: {str(e)}")
-            self.status_var.set(f"Error: {str(e)}")
-            
-            if hasattr(self.selected_device, 'ContentItem'):
-                if hasattr(self.selected_device.ContentItem, 'Source'):
-                    status_parts.append(f"Source: {self.selected_device.ContentItem.Source}")
-                if hasattr(self.selected_device.ContentItem, 'Name') and self.selected_device.ContentItem.Name:
-                    status_parts.append(f"Now Playing: {self.selected_device.ContentItem.Name}")
-            
-            status = '\n'.join(status_parts)
-            self.status_var.set(status)
-            logger.debug("Device status updated: %s", status.replace('\n', ', '))
-            
-        except Exception as e:
-            self.log_error(f"Failed to update device status: {str(e)}", exc_info=True)
+            self._ui(self.log_error, f"Error in update_device_status: {str(e)}", e)
+            self._ui(self.set_status, f"Error: {str(e)}")
     
-    def on_volume_change(self, value):
-        if hasattr(self, 'selected_client') and self.selected_client and not self._updating_volume:
+    def _fetch_status(self, device, client):
+        """Query device through client; blocking, so only call from a worker thread.
+        
+        Returns a tuple of (status_parts, volume, art_url) for _render_status.
+        """
+        status_parts = []
+        volume = None
+        art_url = None
+        
+        # Get basic device info
+        device_name = getattr(device, 'DeviceName', None)
+        if device_name:
+            status_parts.append(device_name)
+        
+        # Get fresh status from the client if available
+        if client:
             try:
-                self._updating_volume = True
-                volume_level = int(float(value))
-                logger.debug(f"Setting volume to {volume_level}")
-                
-                # Update status immediately for better responsiveness
-                current_status = self.status_var.get()
-                if 'Volume:' in current_status:
-                    # Update the volume in the status text
-                    lines = current_status.split('\n')
-                    for i, line in enumerate(lines):
-                        if line.startswith('Volume:'):
-                            lines[i] = f"Volume: {volume_level}%"
-                            break
-                    self.status_var.set('\n'.join(lines))
-                
-                # Set the volume on the device
-                self.selected_client.SetVolumeLevel(volume_level)
-                
+                now_playing = client.GetNowPlayingStatus(True)
+                if now_playing:
+                    # Update power state
+                    power_state = getattr(now_playing, 'PowerState', None)
+                    if power_state is not None:
+                        status_parts.append(f"Power: {power_state}")
+                    
+                    # Update volume if available
+                    if not self._updating_volume:
+                        volume_info = client.GetVolume(True)
+                        volume = volume_info.Actual
+                        status_parts.append(f"Volume: {volume_info.Actual}%")
+                    
+                    # Update content info if available
+                    content = getattr(now_playing, 'ContentItem', None)
+                    for attr, label in _CONTENT_FIELDS:
+                        value = getattr(content, attr, None)
+                        if value:
+                            status_parts.append(f"{label}: {value}")
+                    for attr, label in _NOW_PLAYING_FIELDS:
+                        value = getattr(now_playing, attr, None)
+                        if value:
+                            status_parts.append(f"{label}: {value}")
+                    duration = getattr(now_playing, 'Duration', None)
+                    if duration:
+                        status_parts.append(f"Position: {getattr(now_playing, 'Position', None)} of {duration}")
+                    art_url = getattr(now_playing, 'ArtUrl', None) or None
             except Exception as e:
-                self.log_error(f"Failed to set volume: {str(e)}", exc_info=True)
+                logger.error(f"Error getting device status: {str(e)}")
+                status_parts.append("Status: Error")
+        else:
+            status_parts.append("Status: Not connected")
+        
+        return status_parts, volume, art_url
+    
+    def _render_status(self, device, status_parts, volume, art_url):
+        """Apply fetched status to the UI. Runs on the Tk thread."""
+        if device is not self.selected_device:
+            logger.debug("Discarding status for a device that is no longer selected")
+            return
+        
+        if volume is not None and not self._updating_volume and self._vol_pending is None:
+            # Setting the slider fires on_volume_change; don't echo it back to the device.
+            # While a slider write is pending the slider is newer than this status.
+            self._updating_volume = True
+            try:
+                self.volume_slider.set(volume)
             finally:
                 self._updating_volume = False
+        
+        if art_url and art_url != self.current_artwork_url:
+            self.current_artwork_url = art_url
+            self.update_artwork(art_url)
+        
+        # Update the status display
+        if status_parts:
+            self._status_lines = list(status_parts)
+            self._status_index = {line.split(':', 1)[0]: i
+                                  for i, line in enumerate(status_parts) if ':' in line}
+            self._status_text = "\n".join(status_parts)
+            self.set_status(self._status_text)
+        else:
+            self.set_status("No status available")
+    
+    def on_volume_change(self, value):
+        if self.selected_client and not self._updating_volume:
+            volume_level = int(float(value))
+            logger.debug(f"Setting volume to {volume_level}")
+            
+            # Update status immediately for better responsiveness
+            self._set_volume_line(volume_level)
+            
+            # Debounce the device write so a slider drag sends only the final value,
+            # to the device that was selected when the slider moved
+            self._vol_pending = (self.selected_client, volume_level)
+            if self._vol_after_id:
+                self.root.after_cancel(self._vol_after_id)
+            self._vol_after_id = self.root.after(150, self._commit_volume)
+    
+    def _set_volume_line(self, volume_level):
+        """Rewrite the Volume line in place, as long as the device status is what's on screen."""
+        i = self._status_index.get('Volume')
+        if i is not None and self._last_status == self._status_text:
+            self._status_lines[i] = f"Volume: {volume_level}%"
+            self._status_text = '\n'.join(self._status_lines)
+            self.set_status(self._status_text)
+    
+    def _commit_volume(self):
+        """Send the last volume level chosen on the slider."""
+        self._vol_after_id = None
+        if self._vol_pending is not None:
+            client, volume_level = self._vol_pending
+            self.run_async(self.set_volume(client, volume_level))
+            self._vol_pending = None
     
-    def toggle_power(self):
-        logger.debug(f"toggle_power called - has selected_client: {hasattr(self, 'selected_client')}, selected_client: {getattr(self, 'selected_client', None)}")
-        logger.debug(f"selected_device: {getattr(self, 'selected_device', None)}")
+    async def set_volume(self, client, volume_level):
+        """Send a volume level to the device behind client."""
+        try:
+            await asyncio.to_thread(client.SetVolumeLevel, volume_level)
+            # The cached snapshot now holds a stale volume
+            self._status_cache.pop(getattr(client.Device, 'Host', None), None)
+        except Exception as e:
+            self._ui(self.log_error, f"Failed to set volume: {str(e)}", e)
+    
+    async def toggle_power(self):
+        logger.debug(f"toggle_power called - selected_client: {self.selected_client}")
+        logger.debug(f"selected_device: {self.selected_device}")
         
-        if not hasattr(self, 'selected_client') or not self.selected_client:
+        if not self.selected_client:
             error_msg = "No device client available. "
-            if hasattr(self, 'selected_device'):
+            if self.selected_device:
                 error_msg += f"Device: {self.selected_device}"
-            self.status_var.set(error_msg)
+            self._ui(self.set_status, error_msg)
             logger.error(error_msg)
             return
             
+        client = self.selected_client
         try:
             # Get current power state first
-            now_playing = self.selected_client.GetNowPlayingStatus(True)
+            now_playing = await asyncio.to_thread(client.GetNowPlayingStatus, True)
             print("\nCurrent Now Playing Status:\n%s" % now_playing.ToString())
             if now_playing and hasattr(now_playing, 'PowerState'):
                 # Toggle power based on current state
                 if now_playing.PowerState == 'ON':
-                    self.selected_client.PowerOff()
+                    await asyncio.to_thread(client.PowerOff)
                 else:
-                    self.selected_client.PowerOn()
-                
-                # Update UI after a short delay to allow the device to process the command
-                self.root.after(1000, self.update_device_status)
+                    await asyncio.to_thread(client.PowerOn)
             else:
                 # Fallback to toggle if we can't determine current state
-                self.selected_client.Power()
-                self.root.after(1000, self.update_device_status)
+                await asyncio.to_thread(client.Power)
+            
+            # Update UI after a short delay to allow the device to process the command
+            await asyncio.sleep(1)
+            await self.update_device_status(force=True)
                 
         except Exception as e:
-            self.log_error(f"Error toggling power: {str(e)}", exc_info=True)
-            self.status_var.set(f"Error toggling power: {str(e)}")
+            self._ui(self.log_error, f"Error toggling power: {str(e)}", e)
+            self._ui(self.set_status, f"Error toggling power: {str(e)}")
 
 if __name__ == "__main__":
     root = tk.Tk()